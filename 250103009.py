@@ -22,9 +22,11 @@ You are free to:
 """
 
 import json
+import os
+import struct
 import sys
+from itertools import combinations
 from typing import List, Tuple
-from random import sample
 
 # -------------------------
 # 1. Basic card utilities
@@ -34,23 +36,29 @@ from random import sample
 RANKS = "23456789TJQKA"
 # Map rank character -> numeric value (2..14)
 RANK_VALUE = {r: i + 2 for i, r in enumerate(RANKS)}  # 2..14 (A=14)
+# Suits: Clubs, Diamonds, Hearts, Spades
+SUITS = "CDHS"
+# All 52 card ids, built once (see encode below)
+DECK_IDS = tuple(range(52))
 
 
-def parse_card(card_str: str) -> Tuple[int, str]:
+def encode(card_str: str) -> int:
     """
-    Convert a string like "AH" or "7D" into (rank_value, suit).
+    Convert a string like "AH" or "7D" into a card id 0..51.
 
-    Example:
-        "AH" -> (14, 'H')
-        "7D" -> (7, 'D')
+    id = (rank_value - 2) * 4 + suit_index, so:
+        rank_value = id // 4 + 2
+        suit_index = id % 4
 
-    card_str[0]: rank in "23456789TJQKA"
-    card_str[1]: suit in "CDHS"  (Clubs, Diamonds, Hearts, Spades)
+    Example:
+        "2C" -> 0
+        "7D" -> 21
+        "AS" -> 51
     """
-    return RANK_VALUE[card_str[0]], card_str[1]
+    return (RANK_VALUE[card_str[0]] - 2) * 4 + SUITS.index(card_str[1])
 
 
-def is_straight_3(rank_values: List[int]) -> Tuple[bool, int]:
+def is_straight_3(rank_values: Tuple[int, int, int]) -> Tuple[bool, int]:
     """
     Check if 3 cards form a straight under our custom rules.
 
@@ -67,14 +75,21 @@ def is_straight_3(rank_values: List[int]) -> Tuple[bool, int]:
       [12, 13, 14] -> Q-K-A -> (True, 14)
       [14, 2, 3]   -> A-2-3 -> (True, 3)  (lowest straight)
     """
-    r = sorted(rank_values)
+    # Sort the 3 ranks with a 3-comparator sorting network (no list, no set)
+    a, b, c = rank_values
+    if a > b:
+        a, b = b, a
+    if b > c:
+        b, c = c, b
+    if a > b:
+        a, b = b, a
 
     # Normal consecutive: x, x+1, x+2
-    if r[0] + 1 == r[1] and r[1] + 1 == r[2]:
-        return True, r[2]
+    if b - a == 1 and c - b == 1:
+        return True, c
 
-    # A-2-3 special: {14,2,3} -> treat as straight with high=3
-    if set(r) == {14, 2, 3}:
+    # A-2-3 special: sorted as 2, 3, 14 -> treat as straight with high=3
+    if a == 2 and b == 3 and c == 14:
         return True, 3
 
     return False, 0
@@ -105,37 +120,34 @@ not the tie-break details (you don't strictly need tie-breaks inside your bot).
 """
 
 
-def hand_category(hole: List[str], table: str) -> int:
+def hand_category(hole: List[int], table: int) -> int:
     """
     Compute the hand category for your 3-card hand.
 
     Input:
-        hole  = ["AS", "TD"], etc. (your two private cards)
-        table = "7H"           (community card)
+        hole  = [encode("AS"), encode("TD")], etc. (your two private cards)
+        table = encode("7H")                     (community card)
 
     Returns:
         0..5 as defined above.
     """
-    cards = hole + [table]
-    rank_values, suits = zip(*[parse_card(c) for c in cards])
-    flush = len(set(suits)) == 1  # True if all 3 suits are the same
-
-    # Count how many times each rank appears
-    counts = {}
-    for v in rank_values:
-        counts[v] = counts.get(v, 0) + 1
+    # Card ids carry rank and suit: rank = id // 4 + 2, suit = id % 4
+    r0, s0 = hole[0] // 4 + 2, hole[0] % 4
+    r1, s1 = hole[1] // 4 + 2, hole[1] % 4
+    r2, s2 = table // 4 + 2, table % 4
+    flush = s0 == s1 == s2  # True if all 3 suits are the same
 
-    straight, _ = is_straight_3(list(rank_values))
+    straight, _ = is_straight_3((r0, r1, r2))
 
     if straight and flush:
         return 5  # Straight Flush
-    if 3 in counts.values():
+    if r0 == r1 == r2:
         return 4  # Trips
     if straight:
         return 3  # Straight
     if flush:
         return 2  # Flush
-    if 2 in counts.values():
+    if r0 == r1 or r1 == r2 or r0 == r2:
         return 1  # Pair
     return 0      # High Card
 
@@ -184,42 +196,239 @@ but it CAN see opponent action frequencies over previous rounds
 Use this to think in terms of EXPECTED VALUE (EV), not just raw hand strength.
 """
 # -----------------------------------
-# 4. Monte Carlo Simulation
+# 4. Exact win probabilities
 # -----------------------------------
-def monte_carlo_sim(hole: List[str], table: str, n_simulations: int = 10000) -> Tuple[float, float, float]:
-    """
-    Running Monte Carlo simulation to estimate win/tie/lose probabilities.
 
-    Returns: Win/Tie/Lose probabilities
+# Once our 2 hole cards and the table card are known, 49 cards remain and
+# the opponent holds one of C(49, 2) = 1176 possible pairs of them.
+N_OPP_HANDS = 49 * 48 // 2
+
+
+def _outcome_counts(hole: List[int], table: int, my_category: int) -> Tuple[int, int]:
     """
+    Count the opponent hands (out of N_OPP_HANDS) that we beat and tie.
 
-    my_category = hand_category(hole, table)
-    SUITS = "CDHS"
-    deck = [ r + s for r in RANKS for s in SUITS]
-    known_cards = hole + [table]
-    available_deck = [card for card in deck if card not in known_cards]
+    Input: card ids (see `encode`) and our own `hand_category(hole, table)`.
+    """
+    # Ids equal positions in DECK_IDS, so drop known cards highest first
+    unseen = list(DECK_IDS)
+    for card in sorted(hole + [table], reverse=True):
+        del unseen[card]
     wins = 0
     ties = 0
 
-    for _ in range(n_simulations):
-        opp_hole = sample(available_deck, 2)
+    for opp_hole in combinations(unseen, 2):
         opp_category = hand_category(opp_hole, table)
 
         if my_category > opp_category:
             wins += 1
         elif my_category == opp_category:
             ties += 1
-    
-    prob_win = wins / n_simulations
-    prob_tie = ties / n_simulations
+    return wins, ties
+
+
+def _probabilities(wins: int, ties: int) -> Tuple[float, float, float]:
+    """Turn (wins, ties) out of N_OPP_HANDS into win/tie/lose probabilities."""
+    prob_win = wins / N_OPP_HANDS
+    prob_tie = ties / N_OPP_HANDS
     prob_lose = 1 - prob_win - prob_tie
 
-    return prob_win, prob_lose, prob_tie
+    return prob_win, prob_tie, prob_lose
+
+
+def exact_equity(hole: List[int], table: int, my_category: int) -> Tuple[float, float, float]:
+    """
+    Compute exact win/tie/lose probabilities against a random opponent hand.
+
+    Every one of the N_OPP_HANDS opponent holdings is evaluated, so there
+    is no sampling noise. This is the fallback for `equity` when
+    equity_table.npy is unavailable (about 0.5 ms per call).
+
+    Input: card ids (see `encode`) and our own `hand_category(hole, table)`,
+    which the caller has already computed.
+
+    Returns: Win/Tie/Lose probabilities
+    """
+    return _probabilities(*_outcome_counts(hole, table, my_category))
+
+
+"""
+The whole input space is small: C(52, 2) = 1326 hole pairs times the 50
+possible table cards = 66300 states. Their (wins, ties) counts are
+precomputed once into equity_table.npy (uint16, shape (66300, 2), next to
+this script), so a decision is a single table read. Regenerate it with:
+
+    python 250103009.py --build-equity-table
+
+Building needs NumPy; reading does not. The file is opened once, only its
+fixed .npy header is parsed, and each lookup reads one 4-byte row with
+seek + struct, so a one-shot round never pays the NumPy import. If the
+file is missing or unreadable, `equity` falls back to `exact_equity`.
+Daemon mode (see `serve`) also re-enumerates a few states at start-up and
+stops using a table that disagrees with the current rules.
+"""
+
+N_STATES = 1326 * 50
+EQUITY_TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "equity_table.npy")
+
+
+def state_index(hole: List[int], table: int) -> int:
+    """
+    Perfect hash of (hole, table) card ids into 0..N_STATES-1.
+
+    index = pair_index(low, high) * 50 + table_position, where pair_index
+    enumerates the 1326 hole pairs in order and table_position is the
+    table id among the 50 cards left once the hole cards are removed.
+    """
+    low, high = (hole[0], hole[1]) if hole[0] < hole[1] else (hole[1], hole[0])
+    pair = low * (103 - low) // 2 + (high - low - 1)
+    position = table - (table > low) - (table > high)
+    return pair * 50 + position
+
+
+def build_equity_table():
+    """
+    Write the exact (wins, ties) counts of every state to EQUITY_TABLE_PATH.
+
+    Rows are indexed by `state_index`. Offline only: needs NumPy and takes
+    a few seconds.
+    """
+    import numpy as np
+
+    # category[a, b, c] for every ordered triple of card ids (repeated cards unused).
+    ids = range(52)
+    category = np.array(
+        [[[hand_category((a, b), c) for c in ids] for b in ids] for a in ids],
+        dtype=np.uint8,
+    )
+    opp_pairs = np.array(list(combinations(range(49), 2)))
+    deck = np.arange(52)
+
+    counts = np.zeros((N_STATES, 2), dtype=np.uint16)
+    for low, high in combinations(ids, 2):
+        for table in ids:
+            if table == low or table == high:
+                continue
+            hole = [low, high]
+            my_category = hand_category(hole, table)
+            opp_hands = np.delete(deck, [low, high, table])[opp_pairs]
+            opp_categories = category[opp_hands[:, 0], opp_hands[:, 1], table]
+            counts[state_index(hole, table)] = (
+                np.count_nonzero(opp_categories < my_category),
+                np.count_nonzero(opp_categories == my_category),
+            )
+    np.save(EQUITY_TABLE_PATH, counts)
+
+
+# One state in equity_table.npy: (wins, ties) as little-endian uint16.
+_ROW = struct.Struct("<HH")
+
+# (open file, byte offset of row 0) once equity_table.npy has been opened,
+# False if it is unusable, None if nobody has asked for it yet.
+_equity_table = None
+
+
+def _open_equity_table():
+    """
+    Open equity_table.npy on first use and keep it open for later rounds.
+
+    Returns (file, offset of row 0), or False if the file is missing or is
+    not a C-ordered (N_STATES, 2) uint16 array of the matching size.
+    """
+    global _equity_table
+    if _equity_table is not None:
+        return _equity_table
+    _equity_table = False
+
+    try:
+        f = open(EQUITY_TABLE_PATH, "rb")
+    except OSError:
+        return False
+    try:
+        prefix = f.read(8)
+        if prefix[:6] != b"\x93NUMPY":
+            raise ValueError("not a .npy file")
+        # .npy format 1.x stores the header length as uint16, later versions as uint32.
+        if prefix[6] == 1:
+            (header_len,) = struct.unpack("<H", f.read(2))
+        else:
+            (header_len,) = struct.unpack("<I", f.read(4))
+        header = f.read(header_len).decode("latin1")
+        offset = f.tell()
+        if (
+            "'descr': '<u2'" not in header
+            or "'fortran_order': False" not in header
+            or f"'shape': ({N_STATES}, 2)" not in header
+        ):
+            raise ValueError("unexpected dtype or shape")
+        if os.fstat(f.fileno()).st_size != offset + N_STATES * _ROW.size:
+            raise ValueError("unexpected file size")
+    except (OSError, ValueError, IndexError, struct.error):
+        f.close()
+        return False
+
+    _equity_table = (f, offset)
+    return _equity_table
+
+
+def _read_equity_row(table_file, index: int) -> Tuple[int, int]:
+    """Read the (wins, ties) row `index` from an opened equity table."""
+    f, offset = table_file
+    f.seek(offset + _ROW.size * index)
+    return _ROW.unpack(f.read(_ROW.size))
+
+
+# States re-enumerated by `_check_equity_table` to catch a table built from
+# other rules: a pair (wins = high cards, ties = pairs) and trips (wins =
+# everything below trips) on the same table card.
+_EQUITY_CHECK_STATES = (
+    ([encode("7S"), encode("2C")], encode("7H")),
+    ([encode("7S"), encode("7D")], encode("7H")),
+)
+
+
+def _check_equity_table():
+    """
+    Compare the _EQUITY_CHECK_STATES rows of the equity table with
+    `_outcome_counts`, and fall back to `exact_equity` if they disagree.
+
+    This costs about 1 ms per state, so only the long-running `serve`
+    calls it; one-shot rounds rely on the header checks alone.
+    """
+    global _equity_table
+    table_file = _open_equity_table()
+    if not table_file:
+        return
+    for hole, table in _EQUITY_CHECK_STATES:
+        try:
+            row = _read_equity_row(table_file, state_index(hole, table))
+        except (OSError, struct.error):
+            row = None
+        if row != _outcome_counts(hole, table, hand_category(hole, table)):
+            table_file[0].close()
+            _equity_table = False
+            return
+
+
+def equity(hole: List[int], table: int, my_category: int) -> Tuple[float, float, float]:
+    """
+    Win/tie/lose probabilities, read from the precomputed table when available.
+
+    Input: card ids (see `encode`) and our own `hand_category(hole, table)`;
+    the category is only needed for the `exact_equity` fallback.
+    """
+    table_file = _open_equity_table()
+    if table_file:
+        try:
+            return _probabilities(*_read_equity_row(table_file, state_index(hole, table)))
+        except (OSError, struct.error):
+            pass
+    return exact_equity(hole, table, my_category)
 
 
 
 # -----------------------------------
-# 5. Main strategy function to edit
+# 5. Main strategy function to edit# 5. Main strategy function to edit
 # -----------------------------------
 
 def decide_action(state: dict) -> str:
@@ -239,9 +448,9 @@ def decide_action(state: dict) -> str:
       - Return one of the strings: "FOLD", "CALL", or "RAISE".
     """
 
-    # 1) Extract basic information
-    hole = state["your_hole"]                 # e.g. ["AS", "TD"]
-    table = state["table_card"]               # e.g. "7H"
+    # 1) Extract basic information, encoding cards to ids once
+    hole = [encode(card) for card in state["your_hole"]]  # e.g. ["AS", "TD"]
+    table = encode(state["table_card"])                   # e.g. "7H"
     opp = state.get("opponent_stats") or {"fold": 0, "call": 0, "raise": 0}
     round_number = state.get("round", 1)
 
@@ -252,32 +461,39 @@ def decide_action(state: dict) -> str:
     else:
         opp_fold_rate = opp["fold"] / total_opp_actions
         opp_raise_rate = opp["raise"] / total_opp_actions
-        opp_call_rate = 1 - opp_fold_rate - opp_raise_rate
+    opp_call_rate = 1 - opp_fold_rate - opp_raise_rate
+
+    def expected_values(prob_win: float, prob_lose: float) -> Tuple[float, float]:
+        ev_call = (
+            opp_fold_rate * 2 +
+            opp_call_rate * (prob_win * 2 + prob_lose * (-2)) +
+            opp_raise_rate * (prob_win * 2 + prob_lose * (-3))
+        )
+        ev_raise = (
+            opp_fold_rate * 3 +
+            opp_call_rate * (prob_win * 3 + prob_lose * (-2)) +
+            opp_raise_rate * (prob_win * 3 + prob_lose * (-3))
+        )
+        return ev_call, ev_raise
+
+    ev_fold = -1
 
     # 2) Basic hand strength (0..5)
     #    0: high, 1: pair, 2: flush, 3: straight, 4: trips, 5: straight flush
     category = hand_category(hole, table)
 
-    prob_win, prob_tie, prob_lose = monte_carlo_sim(hole, table, n_simulations= 10000)
+    # 3) Skip the equity computation when it cannot change the action.
+    #    ev_raise - ev_call = opp_fold_rate + (opp_call_rate + opp_raise_rate) * prob_win >= 0,
+    #    so RAISE never loses to CALL: trips and better always RAISE, and a
+    #    straight RAISEs if even a certain loss keeps ev_raise >= ev_fold.
+    if category >= 4:
+        return "RAISE"
+    if category == 3 and expected_values(0.0, 1.0)[1] >= ev_fold:
+        return "RAISE"
 
-    ev_fold = -1
-    ev_call = (
-        opp_fold_rate * 2 +
-        opp_call_rate * (prob_win * 2 + prob_lose * (-2)) +
-        opp_raise_rate * (prob_win * 2 + prob_lose * (-3))
-    )
-    ev_raise = (
-        opp_fold_rate * 3 +
-        opp_call_rate * (prob_win * 3 + prob_lose * (-2)) +
-        opp_raise_rate * (prob_win * 3 + prob_lose * (-3))
-    )
+    prob_win, prob_tie, prob_lose = equity(hole, table, category)
+    ev_call, ev_raise = expected_values(prob_win, prob_lose)
 
-    if category >= 4:
-        if ev_raise >= ev_call or prob_win > 0.85:
-            return "RAISE"
-        else:
-            return "CALL"
-    
     if category == 3:
         if ev_raise >= max(ev_call, ev_fold):
             return "RAISE"
@@ -323,16 +539,12 @@ def decide_action(state: dict) -> str:
 # 6. I/O glue (do not touch)
 # -----------------------------
 
-def main():
+def _respond(raw) -> str:
     """
-    DO NOT modify this unless you know what you're doing.
+    Turn one raw JSON game state (str or bytes) into a valid action.
 
-    It:
-      - Reads one JSON object from stdin.
-      - Calls decide_action(state).
-      - Writes {"action": "..."} as JSON to stdout.
+    Shared by `main` and `serve`.
     """
-    raw = sys.stdin.read().strip()
     try:
         state = json.loads(raw) if raw else {}
     except Exception:
@@ -343,9 +555,69 @@ def main():
     # Safety check: default to CALL if something invalid is returned
     if action not in {"FOLD", "CALL", "RAISE"}:
         action = "CALL"
+    return action
+
 
+def main():
+    """
+    DO NOT modify this unless you know what you're doing.
+
+    It:
+      - Reads one JSON object from stdin.
+      - Calls decide_action(state).
+      - Writes {"action": "..."} as JSON to stdout.
+    """
+    raw = sys.stdin.read().strip()
+    action = _respond(raw)
     sys.stdout.write(json.dumps({"action": action}))
 
 
+"""
+Daemon mode (optional): set POKERBOT_DAEMON=1 and keep one process alive
+for the whole match, so interpreter start-up and the equity table checks
+are paid once instead of every round.
+
+Both directions use the same framing: a 4-byte big-endian length, then
+that many bytes of JSON. The process exits when stdin is closed.
+An engine-side adapter only needs to start the script once and, per round:
+
+    payload = json.dumps(state).encode()
+    proc.stdin.write(struct.pack(">I", len(payload)) + payload)
+    proc.stdin.flush()
+    (length,) = struct.unpack(">I", proc.stdout.read(4))
+    action = json.loads(proc.stdout.read(length))["action"]
+"""
+
+
+def serve():
+    """
+    Answer length-framed game states from stdin until EOF (daemon mode).
+
+    A round that raises is answered with CALL instead of ending the match.
+    """
+    _check_equity_table()
+
+    stdin, stdout = sys.stdin.buffer, sys.stdout.buffer
+    while True:
+        header = stdin.read(4)
+        if len(header) < 4:
+            return
+        (length,) = struct.unpack(">I", header)
+        raw = stdin.read(length).strip()
+        try:
+            action = _respond(raw)
+        except Exception:
+            action = "CALL"
+
+        reply = json.dumps({"action": action}).encode()
+        stdout.write(struct.pack(">I", len(reply)) + reply)
+        stdout.flush()
+
+
 if __name__ == "__main__":
-    main()
+    if sys.argv[1:] == ["--build-equity-table"]:
+        build_equity_table()
+    elif os.environ.get("POKERBOT_DAEMON") == "1":
+        serve()
+    else:
+        main()